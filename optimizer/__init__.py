@@ -3,7 +3,7 @@
 Public API
 ----------
 This package re-exports the key classes and functions so that users
-can write ``from optimizer import RocketSimulator, generate_lhs, ...``.
+can write ``from optimizer import RocketSimulator, generate_samples, ...``.
 """
 
 # Apply JVM patch on package import
@@ -30,10 +30,14 @@ from optimizer.simulation import RocketSimulator  # noqa: E402
 
 # --- doe ---
 from optimizer.doe import (  # noqa: E402
+    generate_samples,
     generate_lhs,
     format_doe_table,
     run_doe,
+    run_doe_parallel,
     check_constraints,
+    check_constraints_batch,
+    records_to_arrays,
     format_doe_results_table,
 )
 
@@ -70,10 +74,14 @@ __all__ = [
     # simulation
     "RocketSimulator",
     # doe
+    "generate_samples",
     "generate_lhs",
     "format_doe_table",
     "run_doe",
+    "run_doe_parallel",
     "check_constraints",
+    "check_constraints_batch",
+    "records_to_arrays",
     "format_doe_results_table",
     # surrogate
     "SurrogateModel",
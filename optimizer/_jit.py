@@ -0,0 +1,31 @@
+"""Optional Numba JIT support.
+
+Numba is an optional dependency (the ``jit`` extra: ``uv sync --extra
+jit``), not a hard one.  When it is installed, :func:`njit` and
+:func:`prange` are the real Numba objects; otherwise they degrade to a
+no-op decorator and :func:`range` so the decorated kernels still run as
+plain Python/NumPy.
+"""
+
+from __future__ import annotations
+
+try:
+    from numba import njit, prange
+
+    HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - depends on the environment
+    HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Fallback for ``numba.njit`` supporting both ``@njit`` and ``@njit(...)``."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def _decorator(func):
+            return func
+
+        return _decorator
+
+
+__all__ = ["HAVE_NUMBA", "njit", "prange"]
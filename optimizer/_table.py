@@ -0,0 +1,35 @@
+"""Markdown table rendering shared by the DOE and results formatters.
+
+Cells are formatted a whole column at a time with NumPy string operations
+rather than one f-string per cell.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+def format_column(values, is_integer: bool = False) -> np.ndarray:
+    """Format a numeric column as strings.
+
+    Integer columns are rendered without decimals; float columns use
+    ``%.4f`` with NaN shown as ``"NaN"``.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if is_integer:
+        return values.astype(np.int64).astype(str)
+    cells = np.char.mod("%.4f", values)
+    cells[np.isnan(values)] = "NaN"
+    return cells
+
+
+def markdown_table(headers: list[str], columns: list[np.ndarray]) -> str:
+    """Render string columns (all the same length) as a Markdown table."""
+    rows = [
+        "| " + " | ".join(headers) + " |",
+        "| " + " | ".join(["---"] * len(headers)) + " |",
+    ]
+    if columns and len(columns[0]):
+        cells = np.column_stack(columns).tolist()
+        rows.extend("| " + " | ".join(row) + " |" for row in cells)
+    return "\n".join(rows)
@@ -10,6 +10,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 if TYPE_CHECKING:
     import orhelper
 
@@ -102,6 +104,42 @@ class OptimizationProblem:
     def upper_bounds(self) -> list[float]:
         return [v.upper_bound for v in self.variables]
 
+    # Array views of the variable and constraint definitions.  Rebuilt on
+    # every access (O(n)) so in-place edits of the definitions are honoured;
+    # callers read each once per batch operation.
+
+    @property
+    def _lb(self) -> np.ndarray:
+        return np.array(self.lower_bounds, dtype=np.float64)
+
+    @property
+    def _ub(self) -> np.ndarray:
+        return np.array(self.upper_bounds, dtype=np.float64)
+
+    @property
+    def _int_mask(self) -> np.ndarray:
+        return np.array([v.is_integer for v in self.variables], dtype=bool)
+
+    @property
+    def _constraint_thresholds(self) -> np.ndarray:
+        return np.array([c.threshold for c in self.constraints], dtype=np.float64)
+
+    @property
+    def _constraint_ops(self) -> np.ndarray:
+        try:
+            codes = [_OPERATOR_CODES[c.operator] for c in self.constraints]
+        except KeyError as exc:
+            raise ValueError(f"Unknown operator: {exc.args[0]}") from None
+        return np.array(codes, dtype=np.int8)
+
+
+# Integer codes for ConstraintOperator used by the vectorized constraint checks
+_OPERATOR_CODES: dict[ConstraintOperator, int] = {
+    ConstraintOperator.GE: 0,
+    ConstraintOperator.LE: 1,
+    ConstraintOperator.EQ: 2,
+}
+
 
 # ---------------------------------------------------------------------------
 # Variable catalog — templates for commonly-used design variables
@@ -175,24 +213,32 @@ def list_components(orh: orhelper.Helper, rocket) -> list[dict]:
     Returns a list of dicts with 'name', 'type', and 'class_name' keys.
     """
     components: list[dict] = []
-
-    def _walk(component):
-        class_name = type(component).__name__
-        # JPype wraps Java types; get the simple Java class name
-        try:
-            java_class = component.getClass().getSimpleName()
-        except Exception:
-            java_class = class_name
+    # JPype creates one Python proxy type per Java class, so the simple Java
+    # class name only needs to be fetched once per type.
+    simple_names: dict[type, str] = {}
+
+    # Iterative pre-order traversal (children pushed in reverse so they are
+    # visited in their original order).
+    stack = [rocket]
+    while stack:
+        component = stack.pop()
+        py_type = type(component)
+        java_class = simple_names.get(py_type)
+        if java_class is None:
+            # JPype wraps Java types; get the simple Java class name
+            try:
+                java_class = str(component.getClass().getSimpleName())
+            except Exception:
+                java_class = py_type.__name__
+            simple_names[py_type] = java_class
         components.append({
             "name": str(component.getName()),
             "type": java_class,
-            "class_name": class_name,
+            "class_name": py_type.__name__,
         })
         child_count = component.getChildCount()
-        for i in range(child_count):
-            _walk(component.getChild(i))
+        stack.extend(component.getChild(i) for i in reversed(range(child_count)))
 
-    _walk(rocket)
     return components
 
 
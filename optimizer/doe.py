@@ -1,4 +1,4 @@
-"""Design of Experiments (DOE) via Latin Hypercube Sampling.
+"""Design of Experiments (DOE) via Latin Hypercube or Sobol sampling.
 
 Generates sample points, runs them through the simulator, and returns
 structured results for downstream surrogate modelling.
@@ -6,42 +6,77 @@ structured results for downstream surrogate modelling.
 
 from __future__ import annotations
 
+import atexit
 import math
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Literal
 
 import numpy as np
 from scipy.stats import qmc
 
-from optimizer.design_space import OptimizationProblem
-from optimizer.simulation import RocketSimulator, check_constraint
+from optimizer._table import format_column, markdown_table
+from optimizer.design_space import Direction, OptimizationProblem
+from optimizer.simulation import RocketSimulator
+
+if TYPE_CHECKING:
+    from optimizer.surrogate import SurrogateModel
 
 
 # ---------------------------------------------------------------------------
-# LHS generation
+# Sample generation
 # ---------------------------------------------------------------------------
 
-def generate_lhs(
+def generate_samples(
     problem: OptimizationProblem,
     n_samples: int = 30,
     seed: int | None = None,
+    method: Literal["lhs", "sobol"] = "lhs",
 ) -> np.ndarray:
-    """Generate LHS samples scaled to the variable bounds.
+    """Generate DOE samples scaled to the variable bounds.
+
+    ``method="lhs"`` uses Latin Hypercube Sampling; ``method="sobol"`` uses
+    a scrambled Sobol sequence, which usually fills the space more evenly
+    for the same number of points.  Sobol points are drawn in a power-of-2
+    block and the first ``n_samples`` are kept.
 
     Returns an (n_samples, n_var) array.  Integer variables are rounded.
     """
-    sampler = qmc.LatinHypercube(d=problem.n_var, seed=seed)
-    unit_samples = sampler.random(n=n_samples)  # in [0, 1]^d
-    lower = np.array(problem.lower_bounds)
-    upper = np.array(problem.upper_bounds)
-    samples = qmc.scale(unit_samples, lower, upper)
+    if method == "lhs":
+        sampler = qmc.LatinHypercube(d=problem.n_var, seed=seed)
+        samples = sampler.random(n=n_samples)  # in [0, 1]^d
+    elif method == "sobol":
+        sampler = qmc.Sobol(d=problem.n_var, scramble=True, seed=seed)
+        m = math.ceil(math.log2(n_samples)) if n_samples > 1 else 0
+        samples = sampler.random_base2(m=m)[:n_samples]
+    else:
+        raise ValueError(f"Unknown sampling method: {method}")
+
+    # Scale to [lower, upper] in place
+    lower = problem._lb
+    np.multiply(samples, problem._ub - lower, out=samples)
+    np.add(samples, lower, out=samples)
 
     # Round integer variables
-    for i, var in enumerate(problem.variables):
-        if var.is_integer:
-            samples[:, i] = np.round(samples[:, i])
+    int_mask = problem._int_mask
+    if int_mask.any():
+        samples[:, int_mask] = np.round(samples[:, int_mask])
 
     return samples
 
 
+def generate_lhs(
+    problem: OptimizationProblem,
+    n_samples: int = 30,
+    seed: int | None = None,
+) -> np.ndarray:
+    """Generate LHS samples scaled to the variable bounds.
+
+    Shorthand for ``generate_samples(problem, n_samples, seed, method="lhs")``.
+    """
+    return generate_samples(problem, n_samples, seed, method="lhs")
+
+
 # ---------------------------------------------------------------------------
 # Formatting
 # ---------------------------------------------------------------------------
@@ -52,18 +87,13 @@ def format_doe_table(
 ) -> str:
     """Format DOE samples as a Markdown table for human review."""
     headers = ["#"] + [v.name for v in problem.variables]
-    rows: list[str] = []
-    rows.append("| " + " | ".join(headers) + " |")
-    rows.append("| " + " | ".join(["---"] * len(headers)) + " |")
-    for i, row in enumerate(samples):
-        cells = [str(i + 1)]
-        for j, val in enumerate(row):
-            if problem.variables[j].is_integer:
-                cells.append(str(int(val)))
-            else:
-                cells.append(f"{val:.4f}")
-        rows.append("| " + " | ".join(cells) + " |")
-    return "\n".join(rows)
+    samples = np.asarray(samples, dtype=np.float64).reshape(-1, problem.n_var)
+    columns = [np.arange(1, len(samples) + 1).astype(str)]
+    columns += [
+        format_column(samples[:, j], var.is_integer)
+        for j, var in enumerate(problem.variables)
+    ]
+    return markdown_table(headers, columns)
 
 
 # ---------------------------------------------------------------------------
@@ -74,6 +104,9 @@ def run_doe(
     simulator: RocketSimulator,
     problem: OptimizationProblem,
     samples: np.ndarray,
+    surrogate: SurrogateModel | None = None,
+    n_seed: int | None = None,
+    min_r2: float = 0.7,
 ) -> list[dict]:
     """Run all DOE sample points and return results.
 
@@ -81,34 +114,264 @@ def run_doe(
     - ``"x"``: the design vector (list of float)
     - one key per objective/constraint name with the extracted scalar
     - ``"feasible"``: whether all constraints are satisfied
+
+    If ``surrogate`` is given, the first ``n_seed`` samples (default
+    ``2 * (n_var + 1)``) are always simulated.  For each later sample the
+    surrogate is (re)fitted on the simulated points and, when its worst LOO
+    R^2 is at least ``min_r2``, samples whose predicted objectives are
+    dominated by the current feasible front are skipped.  Skipped records
+    hold the predicted objectives, NaN constraints, ``"feasible": None``
+    (unknown) and ``"simulated": False``; every record then carries
+    ``"simulated"``.
     """
     results: list[dict] = []
     n = len(samples)
+    if surrogate is not None and n_seed is None:
+        n_seed = min(n, 2 * (problem.n_var + 1))
+
+    obj_names = [o.name for o in problem.objectives]
+    # Objective signs for a minimization-only dominance check
+    signs = np.array([-1.0 if o.direction is Direction.MAXIMIZE else 1.0 for o in problem.objectives])
+    needs_refit = True
+    trusted = False
+    front = np.empty((0, len(obj_names)))
+
     for i, x in enumerate(samples):
+        if surrogate is not None and i >= n_seed:
+            if needs_refit:
+                trusted = _refit_surrogate(surrogate, results, problem, min_r2)
+                front = _feasible_front(results, obj_names, signs)
+                needs_refit = False
+            if trusted:
+                pred = surrogate.predict_single(x)
+                f_pred = np.array([pred[name] for name in obj_names]) * signs
+                if _is_dominated(f_pred, front):
+                    print(f"[DOE] Skipping sample {i + 1}/{n} (predicted dominated)")
+                    results.append(_make_skipped_record(problem, x, pred))
+                    continue
+
         print(f"[DOE] Running sample {i + 1}/{n} ...")
         outcome = simulator.evaluate(problem, x)
-        if outcome is None:
-            outcome = {
-                o.name: float("nan")
-                for o in problem.objectives + problem.constraints  # type: ignore[operator]
-            }
-
-        record: dict = {"x": x.tolist(), **outcome}
-        record["feasible"] = check_constraints(problem, outcome)
+        record = _make_record(problem, x, outcome)
+        if surrogate is not None:
+            record["simulated"] = True
+            needs_refit = True
         results.append(record)
 
     n_feasible = sum(1 for r in results if r["feasible"])
-    print(f"[DOE] Done. {n_feasible}/{n} feasible points.")
+    if surrogate is not None:
+        n_skipped = sum(1 for r in results if not r["simulated"])
+        print(
+            f"[DOE] Done. {n_feasible}/{n - n_skipped} simulated points feasible "
+            f"({n_skipped} skipped by surrogate)."
+        )
+    else:
+        print(f"[DOE] Done. {n_feasible}/{n} feasible points.")
     return results
 
 
+def _refit_surrogate(
+    surrogate: SurrogateModel,
+    results: list[dict],
+    problem: OptimizationProblem,
+    min_r2: float,
+) -> bool:
+    """Refit *surrogate* on the simulated results; return True if it can be trusted."""
+    try:
+        surrogate.fit([r for r in results if r["simulated"]], problem)
+    except ValueError:
+        return False
+    scores = surrogate.get_r2_scores()
+    return min(scores.values()) >= min_r2
+
+
+def _feasible_front(
+    results: list[dict],
+    obj_names: list[str],
+    signs: np.ndarray,
+) -> np.ndarray:
+    """Signed objectives of the simulated, feasible, all-finite records."""
+    F = np.array([
+        [r[name] for name in obj_names]
+        for r in results
+        if r["simulated"] and r["feasible"]
+    ], dtype=np.float64).reshape(-1, len(obj_names))
+    F *= signs
+    return F[np.isfinite(F).all(axis=1)]
+
+
+def _is_dominated(point: np.ndarray, front: np.ndarray) -> bool:
+    """Return True if any row of *front* Pareto-dominates *point* (minimization)."""
+    if len(front) == 0:
+        return False
+    return bool(np.any(np.all(front <= point, axis=1) & np.any(front < point, axis=1)))
+
+
+def _make_skipped_record(
+    problem: OptimizationProblem,
+    x: np.ndarray,
+    predicted: dict[str, float],
+) -> dict:
+    """Build a DOE record for a sample skipped on the surrogate's prediction."""
+    record: dict = {"x": x.tolist(), **predicted}
+    for con in problem.constraints:
+        record[con.name] = float("nan")
+    # Constraints were never evaluated, so feasibility is unknown
+    record["feasible"] = None
+    record["simulated"] = False
+    return record
+
+
+def run_doe_parallel(
+    problem: OptimizationProblem,
+    samples: np.ndarray,
+    n_workers: int = 4,
+) -> list[dict]:
+    """Run DOE sample points across a pool of worker processes.
+
+    Each worker process owns its own :class:`RocketSimulator` (and therefore
+    its own JVM) for ``problem.ork_file``, so no simulator is passed in.
+    Results are returned in sample order with the same layout as
+    :func:`run_doe`.  With ``n_workers <= 1`` the samples are run serially
+    in a simulator opened in the calling process.
+    """
+    n = len(samples)
+    if n_workers <= 1:
+        with RocketSimulator(problem.ork_file) as simulator:
+            return run_doe(simulator, problem, samples)
+
+    results: list[dict | None] = [None] * n
+    # "spawn" so workers never inherit a JVM already started in this process
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        max_workers=n_workers,
+        mp_context=ctx,
+        initializer=_init_worker,
+        initargs=(problem,),
+    ) as pool:
+        futures = [pool.submit(_evaluate_in_worker, i, x.tolist()) for i, x in enumerate(samples)]
+        for done, future in enumerate(as_completed(futures), start=1):
+            i, outcome = future.result()
+            print(f"[DOE] Finished sample {i + 1} ({done}/{n}) ...")
+            results[i] = _make_record(problem, samples[i], outcome)
+
+    n_feasible = sum(1 for r in results if r["feasible"])
+    print(f"[DOE] Done. {n_feasible}/{n} feasible points.")
+    return results  # type: ignore[return-value]
+
+
+def _make_record(
+    problem: OptimizationProblem,
+    x: np.ndarray,
+    outcome: dict[str, float] | None,
+) -> dict:
+    """Build a DOE result record from a design vector and its outcome."""
+    if outcome is None:
+        outcome = {
+            o.name: float("nan")
+            for o in problem.objectives + problem.constraints  # type: ignore[operator]
+        }
+
+    record: dict = {"x": x.tolist(), **outcome}
+    record["feasible"] = check_constraints(problem, outcome)
+    return record
+
+
+# -- worker process state (one simulator / JVM per process) -----------------
+
+_WORKER_SIM: RocketSimulator | None = None
+_WORKER_PROBLEM: OptimizationProblem | None = None
+
+
+def _init_worker(problem: OptimizationProblem) -> None:
+    global _WORKER_SIM, _WORKER_PROBLEM
+    _WORKER_PROBLEM = problem
+    _WORKER_SIM = RocketSimulator(problem.ork_file).__enter__()
+    atexit.register(_WORKER_SIM.__exit__, None, None, None)
+
+
+def _evaluate_in_worker(i: int, x: list[float]) -> tuple[int, dict[str, float] | None]:
+    assert _WORKER_SIM is not None and _WORKER_PROBLEM is not None, "Worker not initialized"
+    return i, _WORKER_SIM.evaluate(_WORKER_PROBLEM, x)
+
+
 def check_constraints(problem: OptimizationProblem, outcome: dict[str, float]) -> bool:
     """Return True if all constraints are satisfied."""
-    for con in problem.constraints:
-        val = outcome.get(con.name, float("nan"))
-        if not check_constraint(con, val):
-            return False
-    return True
+    if not problem.constraints:
+        return True
+    vals = np.array(
+        [outcome.get(con.name, float("nan")) for con in problem.constraints],
+        dtype=np.float64,
+    )
+    return bool(_constraint_mask(problem, vals).all())
+
+
+def check_constraints_batch(
+    problem: OptimizationProblem,
+    outcomes: list[dict[str, float]],
+) -> np.ndarray:
+    """Vectorized :func:`check_constraints` over many outcomes (or DOE records).
+
+    Returns a boolean array with one entry per outcome.
+    """
+    vals = np.array(
+        [[o.get(con.name, float("nan")) for con in problem.constraints] for o in outcomes],
+        dtype=np.float64,
+    ).reshape(len(outcomes), problem.n_constr)
+    return _constraint_mask(problem, vals).all(axis=1)
+
+
+def _constraint_mask(problem: OptimizationProblem, vals: np.ndarray) -> np.ndarray:
+    """Per-constraint satisfaction for values of shape (..., n_constr).
+
+    Mirrors :func:`optimizer.simulation.check_constraint`: NaN never
+    satisfies a constraint and ``EQ`` uses a relative tolerance of 1e-6.
+    """
+    thr = problem._constraint_thresholds
+    ops = problem._constraint_ops
+    ge = (ops == 0) & (vals >= thr)
+    le = (ops == 1) & (vals <= thr)
+    finite = np.isfinite(vals) & np.isfinite(thr)
+    close = (vals == thr) | (finite & (np.abs(vals - thr) <= 1e-6 * np.maximum(np.abs(vals), np.abs(thr))))
+    eq = (ops == 2) & close
+    return ge | le | eq
+
+
+def records_to_arrays(
+    results: list[dict],
+    problem: OptimizationProblem,
+) -> dict[str, np.ndarray]:
+    """Stack DOE result records into NumPy arrays.
+
+    Returns a dict with ``"X"`` (n, n_var), one (n,) array per objective and
+    constraint name (NaN where missing), and boolean ``"feasible"`` and
+    ``"simulated"`` arrays (records without those keys count as True;
+    skipped records, whose feasibility is ``None``, count as infeasible, so
+    filter on ``"simulated"`` first).
+    The record list stays the JSON-friendly interchange format; this is the
+    array form consumed by :class:`SurrogateModel` and the plotting helpers.
+    """
+    n = len(results)
+    names = [item.name for item in problem.objectives + problem.constraints]  # type: ignore[operator]
+
+    # np.fromiter with an explicit count fills one preallocated buffer per
+    # output, without building an intermediate list of per-row objects
+    nan = float("nan")
+    X = np.fromiter(
+        (v for r in results for v in r["x"]), dtype=np.float64, count=n * problem.n_var,
+    ).reshape(n, problem.n_var)
+    values = [
+        np.fromiter((r.get(name, nan) for r in results), dtype=np.float64, count=n)
+        for name in names
+    ]
+    feasible = np.fromiter((r.get("feasible", True) for r in results), dtype=bool, count=n)
+    simulated = np.fromiter((r.get("simulated", True) for r in results), dtype=bool, count=n)
+
+    arrays: dict[str, np.ndarray] = {"X": X}
+    arrays.update(zip(names, values))
+    arrays["feasible"] = feasible
+    arrays["simulated"] = simulated
+    return arrays
 
 
 # ---------------------------------------------------------------------------
@@ -124,24 +387,22 @@ def format_doe_results_table(
     obj_names = [o.name for o in problem.objectives]
     con_names = [c.name for c in problem.constraints]
     headers = ["#"] + var_names + obj_names + con_names + ["feasible"]
+    # Surrogate-screened runs mark every record; show which ones were simulated
+    show_simulated = any("simulated" in r for r in results)
+    if show_simulated:
+        headers.append("simulated")
+
+    data = records_to_arrays(results, problem)
+    X = data["X"]
+    simulated = data["simulated"]
 
-    rows: list[str] = []
-    rows.append("| " + " | ".join(headers) + " |")
-    rows.append("| " + " | ".join(["---"] * len(headers)) + " |")
-    for i, rec in enumerate(results):
-        cells = [str(i + 1)]
-        for j, vn in enumerate(var_names):
-            val = rec["x"][j]
-            if problem.variables[j].is_integer:
-                cells.append(str(int(val)))
-            else:
-                cells.append(f"{val:.4f}")
-        for name in obj_names + con_names:
-            val = rec.get(name, float("nan"))
-            if math.isnan(val):
-                cells.append("NaN")
-            else:
-                cells.append(f"{val:.4f}")
-        cells.append("Yes" if rec["feasible"] else "No")
-        rows.append("| " + " | ".join(cells) + " |")
-    return "\n".join(rows)
+    columns = [np.arange(1, len(X) + 1).astype(str)]
+    columns += [
+        format_column(X[:, j], var.is_integer)
+        for j, var in enumerate(problem.variables)
+    ]
+    columns += [format_column(data[name]) for name in obj_names + con_names]
+    columns.append(np.where(simulated, np.where(data["feasible"], "Yes", "No"), "-"))
+    if show_simulated:
+        columns.append(np.where(simulated, "Yes", "No"))
+    return markdown_table(headers, columns)
@@ -13,6 +13,7 @@ from pymoo.optimize import minimize
 from pymoo.termination import get_termination
 from pymoo.operators.sampling.lhs import LHS as PymooLHS
 
+from optimizer._jit import HAVE_NUMBA, njit
 from optimizer.design_space import Direction, OptimizationProblem
 from optimizer.surrogate import SurrogateModel
 
@@ -27,6 +28,12 @@ class SurrogateProblem(Problem):
     def __init__(self, surrogate: SurrogateModel, problem: OptimizationProblem):
         self.surrogate = surrogate
         self.opt_problem = problem
+        self._obj_names = [obj.name for obj in problem.objectives]
+        # pymoo minimizes; flip sign for maximization objectives
+        self._signs = np.array([
+            -1.0 if obj.direction is Direction.MAXIMIZE else 1.0
+            for obj in problem.objectives
+        ])
 
         xl = np.array(problem.lower_bounds)
         xu = np.array(problem.upper_bounds)
@@ -40,11 +47,9 @@ class SurrogateProblem(Problem):
 
     def _evaluate(self, X, out, *args, **kwargs):
         preds = self.surrogate.predict(X)
-        F = np.column_stack([
-            # pymoo minimizes; flip sign for maximization objectives
-            -preds[obj.name] if obj.direction is Direction.MAXIMIZE else preds[obj.name]
-            for obj in self.opt_problem.objectives
-        ])
+        F = np.empty((len(X), len(self._obj_names)))
+        for j, name in enumerate(self._obj_names):
+            np.multiply(preds[name], self._signs[j], out=F[:, j])
         out["F"] = F
 
 
@@ -111,36 +116,126 @@ def find_knee_point(F: np.ndarray) -> int:
     if n <= 2:
         return 0
 
+    F = np.asarray(F, dtype=np.float64)
     if F.shape[1] == 2:
-        # Normalize to [0, 1]
-        f_min = F.min(axis=0)
-        f_max = F.max(axis=0)
-        f_range = f_max - f_min
-        f_range[f_range == 0] = 1.0
-        F_norm = (F - f_min) / f_range
-
-        # Line from extreme point A to B
-        idx_a = np.argmin(F_norm[:, 0])
-        idx_b = np.argmin(F_norm[:, 1])
-        A = F_norm[idx_a]
-        B = F_norm[idx_b]
-        AB = B - A
-        AB_len = np.linalg.norm(AB)
-        if AB_len == 0:
-            return 0
-
-        # Perpendicular distance from each point to line AB
-        dists = np.abs(np.cross(AB, A - F_norm)) / AB_len
-        return int(np.argmax(dists))
-    else:
-        # 3+ objectives: normalized sum
-        f_min = F.min(axis=0)
-        f_max = F.max(axis=0)
-        f_range = f_max - f_min
-        f_range[f_range == 0] = 1.0
-        F_norm = (F - f_min) / f_range
-        sums = F_norm.sum(axis=1)
-        return int(np.argmin(sums))
+        return int(_knee_2d(F) if HAVE_NUMBA else _knee_2d_np(F))
+    return int(_knee_nd(F) if HAVE_NUMBA else _knee_nd_np(F))
+
+
+def _normalize_front_np(F: np.ndarray) -> np.ndarray:
+    """Vectorized normalization of each objective to [0, 1]."""
+    f_min = F.min(axis=0)
+    f_range = F.max(axis=0) - f_min
+    f_range[f_range == 0] = 1.0
+    return (F - f_min) / f_range
+
+
+def _knee_2d_np(F: np.ndarray) -> int:
+    F_norm = _normalize_front_np(F)
+
+    # Line from extreme point A to B
+    A = F_norm[np.argmin(F_norm[:, 0])]
+    B = F_norm[np.argmin(F_norm[:, 1])]
+    AB = B - A
+    ab_len = np.hypot(AB[0], AB[1])
+    if ab_len == 0:
+        return 0
+
+    # Perpendicular distance from each point to line AB (2-D cross product)
+    D = A - F_norm
+    dists = np.abs(AB[0] * D[:, 1] - AB[1] * D[:, 0]) / ab_len
+    return int(np.argmax(dists))
+
+
+def _knee_nd_np(F: np.ndarray) -> int:
+    # 3+ objectives: normalized sum
+    return int(np.argmin(_normalize_front_np(F).sum(axis=1)))
+
+
+# The kernels below use explicit loops (the idiomatic Numba form) so each
+# front is scanned once for its bounds rather than once per reduction.
+# Interpreted, those loops are far slower than NumPy, so callers only use
+# them when Numba is available and fall back to the ``_np`` versions above.
+
+@njit(cache=True)
+def _front_bounds(F: np.ndarray):
+    """Per-objective min, max and index of the min, in one pass over F."""
+    n, m = F.shape
+    f_min = F[0].copy()
+    f_max = F[0].copy()
+    idx_min = np.zeros(m, dtype=np.int64)
+    for i in range(1, n):
+        for j in range(m):
+            val = F[i, j]
+            if val < f_min[j]:
+                f_min[j] = val
+                idx_min[j] = i
+            elif val > f_max[j]:
+                f_max[j] = val
+    return f_min, f_max, idx_min
+
+
+@njit(cache=True)
+def _normalize_front(F: np.ndarray) -> np.ndarray:
+    """Normalize each objective to [0, 1]."""
+    n, m = F.shape
+    f_min, f_max, _ = _front_bounds(F)
+    F_norm = np.empty((n, m))
+    for j in range(m):
+        f_range = f_max[j] - f_min[j]
+        if f_range == 0:
+            f_range = 1.0
+        for i in range(n):
+            F_norm[i, j] = (F[i, j] - f_min[j]) / f_range
+    return F_norm
+
+
+@njit(cache=True)
+def _knee_2d(F: np.ndarray) -> int:
+    f_min, f_max, idx_min = _front_bounds(F)
+    range0 = f_max[0] - f_min[0]
+    range1 = f_max[1] - f_min[1]
+    if range0 == 0:
+        range0 = 1.0
+    if range1 == 0:
+        range1 = 1.0
+
+    # Line from extreme point A to B, in normalized coordinates
+    idx_a = idx_min[0]
+    idx_b = idx_min[1]
+    a_u = (F[idx_a, 0] - f_min[0]) / range0
+    a_v = (F[idx_a, 1] - f_min[1]) / range1
+    ab_u = (F[idx_b, 0] - f_min[0]) / range0 - a_u
+    ab_v = (F[idx_b, 1] - f_min[1]) / range1 - a_v
+    ab_len = np.sqrt(ab_u * ab_u + ab_v * ab_v)
+    if ab_len == 0:
+        return 0
+
+    # Perpendicular distance from each point to line AB (2-D cross product)
+    best = 0
+    best_dist = -1.0
+    for i in range(F.shape[0]):
+        u = (F[i, 0] - f_min[0]) / range0
+        v = (F[i, 1] - f_min[1]) / range1
+        dist = abs(ab_u * (a_v - v) - ab_v * (a_u - u)) / ab_len
+        if dist > best_dist:
+            best = i
+            best_dist = dist
+    return best
+
+
+@njit(cache=True)
+def _knee_nd(F: np.ndarray) -> int:
+    # 3+ objectives: normalized sum
+    F_norm = _normalize_front(F)
+    best = 0
+    best_sum = np.inf
+    for i in range(F_norm.shape[0]):
+        total = F_norm[i].sum()
+        if total < best_sum:
+            best = i
+            best_sum = total
+    return best
 
 
 def select_top3(
@@ -172,8 +267,7 @@ def select_top3(
     used_indices = {knee_idx}
 
     # Best per objective
-    for obj in problem.objectives:
-        j = [o.name for o in problem.objectives].index(obj.name)
+    for j, obj in enumerate(problem.objectives):
         if obj.direction is Direction.MAXIMIZE:
             best_idx = int(np.argmax(F[:, j]))
         else:
@@ -190,21 +284,14 @@ def select_top3(
 
     # Fill with most distant point
     if len(selected) < 3 and n > len(selected):
-        f_min = F.min(axis=0)
-        f_max = F.max(axis=0)
-        f_range = f_max - f_min
-        f_range[f_range == 0] = 1.0
-        F_norm = (F - f_min) / f_range
-
-        selected_norm = np.array([F_norm[s["index"]] for s in selected])
-        min_dists = np.full(n, np.inf)
-        for i in range(n):
-            if i in used_indices:
-                min_dists[i] = -1
-                continue
-            for s in selected_norm:
-                d = np.linalg.norm(F_norm[i] - s)
-                min_dists[i] = min(min_dists[i], d)
+        F64 = np.asarray(F, dtype=np.float64)
+        F_norm = _normalize_front(F64) if HAVE_NUMBA else _normalize_front_np(F64)
+
+        # Distance from every point to its nearest already-selected point
+        used = np.fromiter(used_indices, dtype=np.intp)
+        diffs = F_norm[:, None, :] - F_norm[used][None, :, :]
+        min_dists = np.sqrt((diffs ** 2).sum(axis=-1)).min(axis=1)
+        min_dists[used] = -np.inf
         farthest = int(np.argmax(min_dists))
         if farthest not in used_indices:
             selected.append({
@@ -7,8 +7,12 @@ scalar objectives from simulation results.
 
 from __future__ import annotations
 
+import hashlib
 import math
-from typing import Any
+import os
+import shelve
+from pathlib import Path
+from typing import Any, Callable
 
 import numpy as np
 
@@ -16,6 +20,7 @@ import optimizer.jvm_patch  # noqa: F401  — ensure patch applied
 import orhelper
 from orhelper import FlightDataType
 
+from optimizer._jit import njit, prange
 from optimizer.design_space import (
     Constraint,
     ConstraintOperator,
@@ -26,19 +31,125 @@ from optimizer.design_space import (
 )
 
 
-def _extract_scalar(series: np.ndarray, extraction: Extraction) -> float:
-    """Extract a scalar value from a 1-D time-series array."""
+# Integer codes for Extraction, understood by the JIT extraction kernels
+_EXTRACT_MAX = 0
+_EXTRACT_MIN = 1
+_EXTRACT_FINAL = 2
+_EXTRACT_MEAN = 3
+
+_EXTRACTION_CODES: dict[Extraction, int] = {
+    Extraction.MAX: _EXTRACT_MAX,
+    Extraction.MIN: _EXTRACT_MIN,
+    Extraction.FINAL: _EXTRACT_FINAL,
+    Extraction.MEAN: _EXTRACT_MEAN,
+}
+
+
+def _extraction_code(extraction: Extraction) -> int:
+    try:
+        return _EXTRACTION_CODES[extraction]
+    except KeyError:
+        raise ValueError(f"Unknown extraction: {extraction}") from None
+
+
+@njit(cache=True)
+def _extract_scalar_nb(series: np.ndarray, code: int) -> float:
     if len(series) == 0:
-        return float("nan")
-    if extraction is Extraction.MAX:
-        return float(np.nanmax(series))
-    if extraction is Extraction.MIN:
-        return float(np.nanmin(series))
-    if extraction is Extraction.FINAL:
-        return float(series[-1])
-    if extraction is Extraction.MEAN:
-        return float(np.nanmean(series))
-    raise ValueError(f"Unknown extraction: {extraction}")
+        return np.nan
+    if code == _EXTRACT_MAX:
+        return np.nanmax(series)
+    if code == _EXTRACT_MIN:
+        return np.nanmin(series)
+    if code == _EXTRACT_FINAL:
+        return series[-1]
+    return np.nanmean(series)
+
+
+@njit(cache=True, parallel=True)
+def _extract_scalar_batch_nb(series_2d: np.ndarray, codes: np.ndarray) -> np.ndarray:
+    """Extract one scalar per row of an (n_series, T) block."""
+    out = np.empty(len(codes))
+    for i in prange(len(codes)):
+        out[i] = _extract_scalar_nb(series_2d[i], codes[i])
+    return out
+
+
+# An extraction plan: the result names, the FlightDataType and integer
+# extraction code of each objective/constraint, and the deduplicated
+# FlightDataTypes to request.
+_ExtractPlan = tuple[tuple[str, ...], tuple[Any, ...], np.ndarray, list[Any]]
+
+
+def _build_extract_plan(
+    objectives: list[ObjectiveFunction],
+    constraints: list[Constraint] | None,
+) -> _ExtractPlan:
+    items = [*objectives, *(constraints or [])]
+    names = tuple(item.name for item in items)
+    types = tuple(getattr(FlightDataType, item.flight_data_type) for item in items)
+    codes = np.array([_extraction_code(item.extraction) for item in items], dtype=np.int64)
+    needed_types = list(dict.fromkeys(types))
+    return names, types, codes, needed_types
+
+
+# ---------------------------------------------------------------------------
+# Shared JVM instance
+# ---------------------------------------------------------------------------
+
+# JPype can start the JVM only once per process, and starting OpenRocket
+# takes seconds, so all simulators share one reference-counted instance.
+_SHARED_INSTANCE: orhelper.OpenRocketInstance | None = None
+_SHARED_REFCOUNT = 0
+
+
+def _acquire_instance() -> orhelper.OpenRocketInstance:
+    global _SHARED_INSTANCE, _SHARED_REFCOUNT
+    if _SHARED_INSTANCE is None:
+        instance = orhelper.OpenRocketInstance()
+        instance.__enter__()
+        _SHARED_INSTANCE = instance
+    _SHARED_REFCOUNT += 1
+    return _SHARED_INSTANCE
+
+
+def _release_instance(*exc) -> None:
+    """Drop one reference; shut the JVM down at zero unless ``OR_KEEPALIVE=1``."""
+    global _SHARED_INSTANCE, _SHARED_REFCOUNT
+    _SHARED_REFCOUNT -= 1
+    if _SHARED_REFCOUNT > 0 or os.environ.get("OR_KEEPALIVE") == "1":
+        return
+    instance, _SHARED_INSTANCE = _SHARED_INSTANCE, None
+    if instance is not None:
+        instance.__exit__(*exc)
+
+
+# ---------------------------------------------------------------------------
+# Shared on-disk cache
+# ---------------------------------------------------------------------------
+
+# dbm backends either lock the file (dbm.gnu) or rewrite its index from
+# their own in-memory copy on close (dbm.dumb), so nested simulators must
+# not open the cache file separately: each path has one reference-counted
+# Shelf shared by every simulator using it.
+_SHARED_SHELVES: dict[str, tuple[shelve.Shelf, int]] = {}
+
+
+def _acquire_shelf(path: str) -> shelve.Shelf:
+    shelf, refcount = _SHARED_SHELVES.get(path) or (None, 0)
+    if shelf is None:
+        shelf = shelve.open(path)
+    _SHARED_SHELVES[path] = (shelf, refcount + 1)
+    return shelf
+
+
+def _release_shelf(path: str) -> None:
+    """Drop one reference to the Shelf at *path*; close it at zero."""
+    shelf, refcount = _SHARED_SHELVES[path]
+    if refcount > 1:
+        _SHARED_SHELVES[path] = (shelf, refcount - 1)
+        return
+    del _SHARED_SHELVES[path]
+    shelf.close()
 
 
 class RocketSimulator:
@@ -48,32 +159,78 @@ class RocketSimulator:
 
         with RocketSimulator("simple.ork") as sim:
             result = sim.evaluate(problem, x_vector)
+
+    With ``persistent_cache=True`` successful outcomes are also stored on
+    disk (directory ``$OR_CACHE_DIR``, default
+    ``~/.cache/openrocket-optimizer``) keyed by the ``.ork`` file contents
+    and mtime, the problem definition and the design vector, so repeated
+    runs across sessions skip already-simulated designs.
+
+    All simulators in a process share one OpenRocket JVM instance, so
+    nested or overlapping ``with`` blocks (e.g. DOE and candidate
+    verification) reuse it; each still loads its own document.  Likewise
+    the on-disk cache file is opened once and shared.  The JVM is
+    shut down when the last simulator exits, unless the ``OR_KEEPALIVE=1``
+    environment variable is set, in which case it stays up so later
+    ``with`` blocks in the same process can start again.
     """
 
-    def __init__(self, ork_file: str):
+    def __init__(self, ork_file: str, persistent_cache: bool = False):
         self.ork_file = ork_file
+        self.persistent_cache = persistent_cache
         self._instance = None
         self._orh: orhelper.Helper | None = None
         self._doc = None
         self._sim = None
+        # Bound Java setters keyed by (component name or None, setter name)
+        self._setters: dict[tuple[str | None, str], Any] = {}
+        # Generated apply functions keyed by the variable fields they bake in
+        self._apply_fns: dict[tuple[tuple[str, str, bool, bool], ...], Callable[[Any], None]] = {}
+        # Java FlightDataType objects keyed by orhelper's FlightDataType
+        self._java_types: dict[FlightDataType, Any] = {}
+        # Per-problem caches are keyed by the problem definition (see
+        # _problem_definition), so in-place edits of a problem or an equal
+        # problem built anew map to the right entries.
+        self._extract_plans: dict[str, _ExtractPlan] = {}
+        # Outcome cache keyed by (problem definition, quantized design vector)
+        self._cache: dict[tuple, dict[str, float]] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+        # On-disk cache (persistent_cache=True), open while entered
+        self._disk: shelve.Shelf | None = None
+        self._disk_path = ""
+        self._file_digest = b""
+        self._disk_prefixes: dict[str, bytes] = {}
 
     # -- context manager ----------------------------------------------------
 
     def __enter__(self) -> RocketSimulator:
-        self._instance = orhelper.OpenRocketInstance()
-        instance = self._instance.__enter__()
-        self._orh = orhelper.Helper(instance)
-        self._doc = self._orh.load_doc(self.ork_file)
-        self._sim = self._doc.getSimulation(0)
+        self._instance = _acquire_instance()
+        try:
+            self._orh = orhelper.Helper(self._instance)
+            self._doc = self._orh.load_doc(self.ork_file)
+            self._sim = self._doc.getSimulation(0)
+            if self.persistent_cache:
+                self._open_disk_cache()
+        except BaseException:
+            self._instance = None
+            _release_instance(None, None, None)
+            raise
         return self
 
     def __exit__(self, *exc):
         if self._instance is not None:
-            self._instance.__exit__(*exc)
+            _release_instance(*exc)
         self._instance = None
         self._orh = None
         self._doc = None
         self._sim = None
+        self._setters.clear()
+        self._apply_fns.clear()
+        self._java_types.clear()
+        if self._disk is not None:
+            _release_shelf(self._disk_path)
+            self._disk = None
 
     # -- accessors ----------------------------------------------------------
 
@@ -99,17 +256,52 @@ class RocketSimulator:
         values: list[float] | np.ndarray,
     ) -> None:
         """Set design variable values on the rocket / simulation options."""
-        opts = self.sim.getOptions()
-        rocket = opts.getRocket()
-        for var, val in zip(variables, values):
-            if var.is_integer:
-                val = int(round(val))
+        key = tuple(
+            (var.component_name, var.setter_method, var.is_integer, var.is_simulation_option)
+            for var in variables
+        )
+        apply = self._apply_fns.get(key)
+        if apply is None:
+            apply = self._compile_apply(variables)
+            self._apply_fns[key] = apply
+        apply(values)
+
+    def _compile_apply(self, variables: list[DesignVariable]) -> Callable[[Any], None]:
+        """Generate a straight-line function applying *variables* in order.
+
+        The body has one call per variable with its bound setter and integer
+        rounding baked in, so applying a design involves no per-variable
+        lookups or flag checks.
+        """
+        namespace: dict[str, Any] = {}
+        lines = ["def _apply(values):"]
+        for i, var in enumerate(variables):
+            namespace[f"set_{i}"] = self._setter(var)
+            value = f"int(round(values[{i}]))" if var.is_integer else f"values[{i}]"
+            lines.append(f"    set_{i}({value})")
+        if not variables:
+            lines.append("    pass")
+        exec("\n".join(lines), namespace)
+        return namespace["_apply"]
+
+    def _setter(self, var: DesignVariable):
+        """Return the bound Java setter for *var*, resolving it on first use.
+
+        Component lookup (a walk over the rocket tree) and JPype method
+        resolution happen once per (component, setter) for the loaded
+        document instead of on every call.
+        """
+        key = (None if var.is_simulation_option else var.component_name, var.setter_method)
+        setter = self._setters.get(key)
+        if setter is None:
+            opts = self.sim.getOptions()
             if var.is_simulation_option:
                 target = opts
             else:
-                target = self.orh.get_component_named(rocket, var.component_name)
+                target = self.orh.get_component_named(opts.getRocket(), var.component_name)
             setter = getattr(target, var.setter_method)
-            setter(val)
+            self._setters[key] = setter
+        return setter
 
     # -- simulation & extraction -------------------------------------------
 
@@ -122,26 +314,48 @@ class RocketSimulator:
 
         Returns a dict mapping name -> scalar value.
         """
-        # Collect all FlightDataType enums we need
-        needed_types: dict[str, Any] = {}
-        for obj in objectives:
-            needed_types[obj.flight_data_type] = getattr(FlightDataType, obj.flight_data_type)
-        if constraints:
-            for con in constraints:
-                needed_types[con.flight_data_type] = getattr(FlightDataType, con.flight_data_type)
+        return self._run_plan(_build_extract_plan(objectives, constraints))
+
+    def _extract_plan(self, problem: OptimizationProblem, definition: str) -> _ExtractPlan:
+        """Return the (cached) extraction plan for *problem*."""
+        plan = self._extract_plans.get(definition)
+        if plan is None:
+            plan = _build_extract_plan(problem.objectives, problem.constraints)
+            self._extract_plans[definition] = plan
+        return plan
+
+    def _java_flight_data_type(self, fdt: FlightDataType):
+        """Return the Java FlightDataType for *fdt*, resolved once per JVM session."""
+        java_fdt = self._java_types.get(fdt)
+        if java_fdt is None:
+            java_fdt = self.orh.translate_flight_data_type(fdt)
+            self._java_types[fdt] = java_fdt
+        return java_fdt
 
+    def _run_plan(self, plan: _ExtractPlan) -> dict[str, float]:
+        names, types, codes, needed_types = plan
         self.orh.run_simulation(self.sim)
-        data = self.orh.get_timeseries(self.sim, list(needed_types.values()))
-
-        results: dict[str, float] = {}
-        for obj in objectives:
-            fdt = needed_types[obj.flight_data_type]
-            results[obj.name] = _extract_scalar(data[fdt], obj.extraction)
-        if constraints:
-            for con in constraints:
-                fdt = needed_types[con.flight_data_type]
-                results[con.name] = _extract_scalar(data[fdt], con.extraction)
-        return results
+        # Same as orh.get_timeseries, but with the Java enums resolved once
+        # instead of a JPype attribute lookup per type per simulation.
+        branch = self.sim.getSimulatedData().getBranch(0)
+        data = {
+            fdt: np.array(branch.get(self._java_flight_data_type(fdt)))
+            for fdt in needed_types
+        }
+
+        series = [data[fdt] for fdt in types]
+        if len({len(s) for s in series}) == 1:
+            # All series come from the same branch: extract in one kernel call
+            block = np.empty((len(series), len(series[0])))
+            for i, s in enumerate(series):
+                block[i] = s
+            values = _extract_scalar_batch_nb(block, codes)
+        else:
+            values = [
+                _extract_scalar_nb(np.asarray(s, dtype=np.float64), code)
+                for s, code in zip(series, codes)
+            ]
+        return {name: float(v) for name, v in zip(names, values)}
 
     def evaluate(
         self,
@@ -150,16 +364,80 @@ class RocketSimulator:
     ) -> dict[str, float] | None:
         """Apply design, run simulation, extract objectives & constraints.
 
-        Returns None (with NaN results) if the simulation fails.
+        Returns None (with NaN results) if the simulation fails.  Outcomes
+        (including failures) are cached per problem and design vector, so
+        re-evaluating an identical ``x`` does not re-run the simulation;
+        with ``persistent_cache`` successful outcomes are also read from and
+        written to the on-disk cache.  A cache hit does not call
+        :meth:`apply_design`, so :attr:`sim` then still holds the last
+        *simulated* design rather than ``x``.
         """
+        definition = _problem_definition(problem)
+        key = (definition, _design_key(x))
+        cached = self._cache.get(key)
+        if cached is not None:
+            self.cache_hits += 1
+            return dict(cached)
+
+        disk_key = self._disk_key(definition, key[1]) if self._disk is not None else None
+        if disk_key is not None and disk_key in self._disk:
+            self.cache_hits += 1
+            outcome = self._disk[disk_key]
+            self._cache[key] = outcome
+            return dict(outcome)
+        self.cache_misses += 1
+
         try:
             self.apply_design(problem.variables, x)
-            return self.run_and_extract(problem.objectives, problem.constraints)
+            outcome = self._run_plan(self._extract_plan(problem, definition))
         except Exception as exc:
             print(f"[Simulator] evaluation failed: {exc}")
             # Return NaN for all objectives and constraints
             names = [o.name for o in problem.objectives] + [c.name for c in problem.constraints]
-            return {name: float("nan") for name in names}
+            outcome = {name: float("nan") for name in names}
+        else:
+            # Only successful simulations are persisted
+            if disk_key is not None:
+                self._disk[disk_key] = outcome
+
+        self._cache[key] = outcome
+        return dict(outcome)
+
+    def _open_disk_cache(self) -> None:
+        cache_dir = Path(os.environ.get("OR_CACHE_DIR", "~/.cache/openrocket-optimizer")).expanduser()
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        path = Path(self.ork_file)
+        digest = hashlib.blake2b(path.read_bytes(), digest_size=16)
+        digest.update(str(path.stat().st_mtime_ns).encode())
+        self._file_digest = digest.digest()
+        self._disk_prefixes.clear()
+        self._disk_path = str(cache_dir / "simulations")
+        self._disk = _acquire_shelf(self._disk_path)
+
+    def _disk_key(self, definition: str, x_key: tuple[float, ...]) -> str:
+        """Persistent cache key for (ork file, problem definition, design vector)."""
+        prefix = self._disk_prefixes.get(definition)
+        if prefix is None:
+            prefix = self._file_digest + hashlib.blake2b(definition.encode(), digest_size=16).digest()
+            self._disk_prefixes[definition] = prefix
+        x_bytes = np.array(x_key, dtype=np.float64).tobytes()
+        return hashlib.blake2b(prefix + x_bytes, digest_size=16).hexdigest()
+
+    def clear_cache(self) -> None:
+        """Drop all cached outcomes and reset the hit/miss counters."""
+        self._cache.clear()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+
+def _problem_definition(problem: OptimizationProblem) -> str:
+    """Cache key for everything in *problem* that affects a simulation outcome."""
+    return repr((problem.variables, problem.objectives, problem.constraints))
+
+
+def _design_key(x: list[float] | np.ndarray) -> tuple[float, ...]:
+    """Hashable cache key for a design vector (rounded to absorb float noise)."""
+    return tuple(round(float(v), 8) for v in x)
 
 
 def check_constraint(constraint: Constraint, value: float) -> bool:
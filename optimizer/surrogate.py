@@ -6,65 +6,338 @@ for fitting from DOE results and leave-one-out cross-validation.
 
 from __future__ import annotations
 
-import math
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import combinations_with_replacement
+from typing import Callable, Literal, NamedTuple
 
 import numpy as np
 from scipy.interpolate import RBFInterpolator
+from scipy.linalg import lu_factor, lu_solve
+from scipy.spatial.distance import cdist, pdist, squareform
+from scipy.special import xlogy
 
+from optimizer._jit import HAVE_NUMBA, njit, prange
 from optimizer.design_space import OptimizationProblem
+from optimizer.doe import records_to_arrays
+
+
+# Up to this many elements scipy's xlogy is the cheapest TPS evaluation
+# (fewest ufunc calls); beyond it NumPy's SIMD log is several times faster.
+_XLOGY_MAX_SIZE = 256
+
+
+def _thin_plate_spline(r: np.ndarray) -> np.ndarray:
+    """``r**2 * log(r)`` with the r = 0 limit of 0, without NaN/inf warnings."""
+    if r.size <= _XLOGY_MAX_SIZE:
+        return xlogy(r * r, r)
+    out = np.zeros_like(r)
+    np.log(r, out=out, where=r > 0)
+    out *= r
+    out *= r
+    return out
+
+
+# Kernels without a shape parameter, with the same sign convention and
+# default polynomial degree as scipy's RBFInterpolator.
+_SCALE_INVARIANT_KERNELS = {
+    "linear": (lambda r: -r, 0),
+    "thin_plate_spline": (_thin_plate_spline, 1),
+    "cubic": (lambda r: r**3, 1),
+    "quintic": (lambda r: -(r**5), 2),
+}
+
+
+def _polynomial_matrix(X: np.ndarray, degree: int) -> np.ndarray:
+    """Monomials of ``X`` up to total degree ``degree``, one column each."""
+    n, ndim = X.shape
+    columns = [np.ones(n)]
+    for d in range(1, degree + 1):
+        for idx in combinations_with_replacement(range(ndim), d):
+            columns.append(np.prod(X[:, idx], axis=1))
+    return np.column_stack(columns)
+
+
+def _fitted_params(model: RBFInterpolator) -> tuple[np.ndarray, ...] | None:
+    """Arrays defining a fitted global RBFInterpolator for a custom evaluator.
+
+    Returns ``(nodes, shift, scale, coeffs, powers)`` where ``coeffs`` holds
+    the ``N`` kernel coefficients followed by the polynomial ones, or None if
+    scipy's private attribute layout is not the expected one.
+    """
+    try:
+        arrays = (model.y, model._shift, model._scale, model._coeffs)
+        powers = model.powers
+    except AttributeError:  # pragma: no cover - depends on the scipy version
+        return None
+    return tuple(np.ascontiguousarray(a, dtype=np.float64) for a in arrays) + (
+        np.ascontiguousarray(powers, dtype=np.int64),
+    )
+
+
+@njit(cache=True, parallel=True, fastmath=True)
+def _eval_tps_nb(Xq, nodes, shift, scale, coeffs, powers):
+    """Evaluate a fitted thin-plate-spline RBF (epsilon 1) at the rows of Xq."""
+    nq, ndim = Xq.shape
+    n = nodes.shape[0]
+    n_out = coeffs.shape[1]
+    out = np.zeros((nq, n_out))
+    for q in prange(nq):
+        for i in range(n):
+            r2 = 0.0
+            for d in range(ndim):
+                diff = Xq[q, d] - nodes[i, d]
+                r2 += diff * diff
+            if r2 > 0.0:
+                phi = 0.5 * r2 * np.log(r2)  # r^2 log r
+                for j in range(n_out):
+                    out[q, j] += phi * coeffs[i, j]
+        # Polynomial tail on the shifted/scaled coordinates
+        for p in range(powers.shape[0]):
+            mono = 1.0
+            for d in range(ndim):
+                xs = (Xq[q, d] - shift[d]) / scale[d]
+                for _ in range(powers[p, d]):
+                    mono *= xs
+            for j in range(n_out):
+                out[q, j] += mono * coeffs[n + p, j]
+    return out
+
+
+# ``neighbors="auto"``: DOEs larger than this use a local RBF of this many
+# nearest neighbours instead of one global O(N^3) system
+_AUTO_NEIGHBORS_MIN_POINTS = 200
+_AUTO_NEIGHBORS = 50
+# Query rows evaluated per block by the NumPy evaluator
+_PREDICT_CHUNK = 4096
+# Reduced-precision evaluation is kept only if it reproduces the training
+# targets with at least this R^2 for every objective
+_REDUCED_PRECISION_MIN_R2 = 1.0 - 1e-6
+# The custom evaluators read scipy's private fit attributes, so after each
+# fit they are checked against the scipy model on this many training rows
+# (relative tolerance; the JIT kernel uses fastmath)
+_FAST_PATH_CHECK_ROWS = 8
+_FAST_PATH_RTOL = 1e-6
+
+
+class _FastPlan(NamedTuple):
+    """Per-fit constants of the NumPy evaluator (see ``_fast_call``)."""
+
+    phi: Callable[[np.ndarray], np.ndarray]
+    nodes: np.ndarray          # (N, ndim)
+    kernel_coeffs: np.ndarray  # (N, n_obj)
+    # Degree <= 1: the tail is folded into ``Xq @ linear + offset``
+    linear: np.ndarray | None  # (ndim, n_obj)
+    offset: np.ndarray | None  # (n_obj,)
+    # Degree >= 2: general monomial tail on shifted/scaled coordinates
+    shift: np.ndarray
+    inv_scale: np.ndarray
+    mono_idx: np.ndarray | None  # (n_mono, degree) columns of [1, Xs]
+    poly_coeffs: np.ndarray      # (n_mono, n_obj)
+
+
+def _build_fast_plan(
+    kernel: str,
+    params: tuple[np.ndarray, ...],
+    dtype: np.dtype = np.dtype(np.float64),
+) -> _FastPlan:
+    """Precompute everything in the evaluation that depends only on the fit.
+
+    The kernel coefficients are stored in ``dtype`` and the kernel matrix is
+    evaluated in it (see :meth:`SurrogateModel._fast_call`); the small
+    polynomial tail stays float64.
+    """
+    nodes, shift, scale, coeffs, powers = params
+    n, ndim = nodes.shape
+    poly_coeffs = coeffs[n:]
+    degrees = powers.sum(axis=1)
+    inv_scale = 1.0 / scale
+
+    linear = offset = mono_idx = None
+    if degrees.max() <= 1:
+        # c_0 + ((x - shift) / scale) @ c_1 == x @ (c_1 / scale) + (c_0 - shift @ (c_1 / scale))
+        linear = np.zeros((ndim, coeffs.shape[1]))
+        offset = np.zeros(coeffs.shape[1])
+        for row, c in zip(powers, poly_coeffs):
+            if row.any():
+                d = int(row.argmax())
+                linear[d] += c * inv_scale[d]
+            else:
+                offset += c
+        offset -= shift @ linear
+    else:
+        # Column 0 of [1, Xs] is all ones, so every monomial is the product of
+        # ``degree`` gathered columns (padded with column 0).
+        degree = int(degrees.max())
+        mono_idx = np.zeros((len(powers), degree), dtype=np.intp)
+        for p, row in enumerate(powers):
+            cols = np.repeat(np.arange(1, ndim + 1), row)
+            mono_idx[p, : len(cols)] = cols
+
+    return _FastPlan(
+        phi=_SCALE_INVARIANT_KERNELS[kernel][0],
+        nodes=nodes,
+        kernel_coeffs=np.ascontiguousarray(coeffs[:n], dtype=dtype),
+        linear=linear,
+        offset=offset,
+        shift=shift,
+        inv_scale=inv_scale,
+        mono_idx=mono_idx,
+        poly_coeffs=np.ascontiguousarray(poly_coeffs),
+    )
+
+
+def _loo_predict(
+    i: int,
+    X: np.ndarray,
+    Y: np.ndarray,
+    kernel: str,
+    neighbors: int | None = None,
+) -> np.ndarray:
+    """Predict ``Y[i]`` from a model refitted without point ``i``."""
+    mask = np.ones(len(X), dtype=bool)
+    mask[i] = False
+    loo_model = RBFInterpolator(X[mask], Y[mask], kernel=kernel, neighbors=neighbors)
+    return loo_model(X[[i]])[0]
 
 
 class SurrogateModel:
     """Multi-output RBF surrogate built from DOE results.
 
-    One :class:`RBFInterpolator` is constructed per objective function.
+    A single :class:`RBFInterpolator` is fitted on all objectives at once
+    (one column of ``y`` per objective), so the interpolation system is
+    factorized once and shared by every objective.
+
+    ``dtype`` selects the precision used to evaluate predictions (the linear
+    solve is always float64).  ``np.float32`` halves the memory traffic
+    through the ``(n_query, N)`` kernel matrix, which dominates prediction
+    cost for large DOEs; :meth:`fit` falls back to float64 if float32 does
+    not reproduce the training data.
+
+    ``cache_size`` > 0 keeps that many predicted rows in an LRU cache keyed
+    by the exact query row, cleared on :meth:`fit`.  It pays off when the
+    same designs are queried repeatedly (e.g. re-plotting a fixed grid);
+    NSGA-II in :mod:`optimizer.pareto` never repeats a row across
+    generations, so it is off by default.
     """
 
-    def __init__(self):
-        self._models: dict[str, RBFInterpolator] = {}
+    def __init__(self, dtype: type[np.floating] = np.float64, cache_size: int = 0):
+        self._dtype = np.dtype(dtype)
+        self._cache_size = cache_size
+        self._model: RBFInterpolator | None = None
+        self._kernel = "thin_plate_spline"
+        self._neighbors: int | None = None
         self._obj_names: list[str] = []
         self._X: np.ndarray | None = None
-        self._Y: dict[str, np.ndarray] = {}
+        self._Y: np.ndarray | None = None  # (n, n_obj), columns follow _obj_names
+        self._D: np.ndarray | None = None  # (n, n) pairwise distances of _X
+        self._loo_lu: tuple[np.ndarray, np.ndarray] | None = None
+        self._eval_params: tuple[np.ndarray, ...] | None = None
+        self._plan: _FastPlan | None = None
+        self._use_jit = False
+        # LRU cache: query row bytes -> (n_obj,) prediction; cleared on fit
+        self._cache: OrderedDict[bytes, np.ndarray] = OrderedDict()
 
     # -- fitting ------------------------------------------------------------
 
     def fit(
         self,
-        doe_results: list[dict],
+        doe_results: list[dict] | dict[str, np.ndarray],
         problem: OptimizationProblem,
         kernel: str = "thin_plate_spline",
+        neighbors: int | Literal["auto"] | None = None,
     ) -> None:
-        """Fit one RBF per objective using feasible DOE points.
+        """Fit the multi-output RBF using feasible DOE points.
+
+        ``kernel`` must be one without a shape parameter (``"linear"``,
+        ``"thin_plate_spline"``, ``"cubic"`` or ``"quintic"``); no
+        ``epsilon`` is passed to :class:`RBFInterpolator`.
 
-        Infeasible (NaN-objective) points are excluded.
+        ``doe_results`` is either the record list returned by ``run_doe`` or
+        its :func:`~optimizer.doe.records_to_arrays` form.  Infeasible
+        (NaN-objective) points and records skipped by a surrogate-screened
+        DOE (``"simulated": False``) are excluded.
+
+        ``neighbors`` is passed to :class:`RBFInterpolator`: None (default)
+        fits one global RBF, an int a local RBF on that many nearest points
+        per query, and ``"auto"`` uses 50 neighbours above 200 valid points
+        and a global RBF otherwise.  Local models trade the O(N^3) fit for a
+        small solve per query; they are evaluated by scipy and validated with
+        k-NN refits in :meth:`get_r2_scores`.  A neighbourhood that does not
+        span every variable (e.g. all points share one integer value) makes
+        the polynomial tail singular, so local mode is opt-in.
         """
         self._obj_names = [o.name for o in problem.objectives]
+        if isinstance(doe_results, dict):
+            data = doe_results
+        else:
+            data = records_to_arrays(doe_results, problem)
 
-        # Filter to rows where all objectives are finite
-        valid = [
-            r for r in doe_results
-            if all(not math.isnan(r.get(name, float("nan"))) for name in self._obj_names)
-        ]
-        if len(valid) < 2:
+        # Filter to simulated rows where all objectives are finite
+        Y_all = np.empty((len(data["X"]), len(self._obj_names)))
+        for j, name in enumerate(self._obj_names):
+            Y_all[:, j] = data[name]
+        valid = np.isfinite(Y_all).all(axis=1)
+        if "simulated" in data:
+            valid &= data["simulated"]
+        n_valid = int(valid.sum())
+        if n_valid < 2:
             raise ValueError(
-                f"Need at least 2 valid DOE points to fit; got {len(valid)}"
+                f"Need at least 2 valid DOE points to fit; got {n_valid}"
             )
 
-        X = np.array([r["x"] for r in valid])
+        X = data["X"][valid]
+        Y = Y_all[valid]
         self._X = X
+        self._Y = Y
+        if neighbors == "auto":
+            neighbors = _AUTO_NEIGHBORS if n_valid > _AUTO_NEIGHBORS_MIN_POINTS else None
+        self._neighbors = neighbors
+        self._kernel = kernel
+        self._model = RBFInterpolator(X, Y, kernel=kernel, neighbors=neighbors)
+        self._loo_lu = None
+        self._cache.clear()
+        # Global models only: the distances are shared by the LOO system and
+        # any distance-based diagnostics, and custom evaluators bypass
+        # scipy's per-call overhead
+        global_fit = neighbors is None
+        self._D = squareform(pdist(X)) if global_fit else None
+        self._eval_params = (
+            _fitted_params(self._model)
+            if global_fit and kernel in _SCALE_INVARIANT_KERNELS
+            else None
+        )
+        self._plan = None
+        self._use_jit = False
+        if self._eval_params is not None:
+            self._plan = _build_fast_plan(kernel, self._eval_params)
+            self._use_jit = HAVE_NUMBA and kernel == "thin_plate_spline"
+            if not self._check_fast_path():
+                self._eval_params = None
+                self._plan = None
+                self._use_jit = False
+            elif self._dtype != np.float64:
+                # The JIT kernel evaluates in float64, so it only replaces float64 plans
+                self._plan = _build_fast_plan(kernel, self._eval_params, self._dtype)
+                self._use_jit = False
+                self._check_reduced_precision()
 
-        for name in self._obj_names:
-            y = np.array([r[name] for r in valid])
-            self._Y[name] = y
-            self._models[name] = RBFInterpolator(X, y, kernel=kernel)
-
-        print(f"[Surrogate] Fitted {len(self._models)} models on {len(valid)} points.")
+        mode = f" ({neighbors}-neighbour local RBF)" if neighbors is not None else ""
+        print(f"[Surrogate] Fitted {len(self._obj_names)} objectives on {n_valid} points{mode}.")
 
     # -- prediction ---------------------------------------------------------
 
     def predict(self, X: np.ndarray) -> dict[str, np.ndarray]:
         """Predict all objectives for multiple input points.
 
+        The multi-output model is evaluated once for all objectives: scipy
+        applies the coefficients as a single ``(n, N) @ (N, n_obj)`` product
+        instead of one kernel evaluation per objective, and the returned
+        arrays are column views of that one result.  Kernels without a shape
+        parameter skip the scipy wrapper: with Numba installed, thin-plate-
+        spline models are evaluated by a JIT kernel; otherwise by
+        :meth:`_fast_call`, a NumPy path built on ``cdist``.
+
         Parameters
         ----------
         X : (n, n_var) array
@@ -73,37 +346,163 @@ class SurrogateModel:
         -------
         dict mapping objective name -> (n,) prediction array
         """
-        return {name: model(X) for name, model in self._models.items()}
+        out = self._evaluate(X)
+        return {name: out[:, j] for j, name in enumerate(self._obj_names)}
+
+    def _evaluate(self, X) -> np.ndarray:
+        """Evaluate the fitted model at the rows of ``X``; returns ``(n, n_obj)``.
+
+        With a prediction cache, rows are looked up in the LRU cache first
+        and only the misses are evaluated.
+        """
+        if self._model is None:
+            raise RuntimeError("Model not fitted yet.")
+        X = self._as_query(X)
+        if self._cache_size <= 0:
+            return self._evaluate_uncached(X)
+        # One bytes key per row, via a structured void view of the row
+        keys = X.view(np.dtype((np.void, X.itemsize * X.shape[1]))).ravel().tolist()
+        cache = self._cache
+        out = np.empty((len(X), len(self._obj_names)))
+        miss = []
+        for i, key in enumerate(keys):
+            hit = cache.get(key)
+            if hit is None:
+                miss.append(i)
+            else:
+                out[i] = hit
+                cache.move_to_end(key)
+        if miss:
+            Y_miss = self._evaluate_uncached(X[miss])
+            out[miss] = Y_miss
+            for i, row in zip(miss, Y_miss):
+                cache[keys[i]] = row
+            while len(cache) > self._cache_size:
+                cache.popitem(last=False)
+        return out
+
+    def _evaluate_uncached(self, X: np.ndarray) -> np.ndarray:
+        """Dispatch to the JIT kernel, the NumPy plan or the scipy model."""
+        if self._use_jit:
+            out = _eval_tps_nb(X, *self._eval_params)
+        elif self._plan is not None:
+            if len(X) <= _PREDICT_CHUNK:
+                out = self._fast_call(X)
+            else:
+                # Evaluate in row blocks so the (rows, N) kernel temporaries
+                # stay bounded (and cache-sized) however many points are queried
+                out = np.empty((len(X), len(self._obj_names)))
+                for start in range(0, len(X), _PREDICT_CHUNK):
+                    block = slice(start, start + _PREDICT_CHUNK)
+                    out[block] = self._fast_call(X[block])
+        else:
+            out = self._model(X)
+        return out
+
+    def _fast_call(self, Xq: np.ndarray) -> np.ndarray:
+        """Evaluate the fitted model at ``Xq`` with the precomputed plan.
+
+        Distances come from :func:`~scipy.spatial.distance.cdist`, the kernel
+        is applied elementwise and all objectives are combined in one matmul;
+        for degree <= 1 the polynomial tail is one more matmul.
+        """
+        plan = self._plan
+        # cdist always returns float64; cast before the kernel and matmul so
+        # both run in the plan's dtype, then accumulate the tail in float64
+        K = cdist(Xq, plan.nodes).astype(plan.kernel_coeffs.dtype, copy=False)
+        out = np.asarray(plan.phi(K) @ plan.kernel_coeffs, dtype=np.float64)
+        if plan.mono_idx is None:
+            out += Xq @ plan.linear
+            out += plan.offset
+        else:
+            Xs = np.empty((len(Xq), Xq.shape[1] + 1))
+            Xs[:, 0] = 1.0
+            np.subtract(Xq, plan.shift, out=Xs[:, 1:])
+            Xs[:, 1:] *= plan.inv_scale
+            out += np.prod(Xs[:, plan.mono_idx], axis=2) @ plan.poly_coeffs
+        return out
+
+    def _check_fast_path(self) -> bool:
+        """Return True if the float64 custom evaluators reproduce scipy's model."""
+        Xk = self._X[:_FAST_PATH_CHECK_ROWS]
+        ref = self._model(Xk)
+        atol = _FAST_PATH_RTOL * np.abs(ref).max(axis=0)
+        outs = [self._fast_call(Xk)]
+        if self._use_jit:
+            outs.append(_eval_tps_nb(Xk, *self._eval_params))
+        if all(np.allclose(out, ref, rtol=_FAST_PATH_RTOL, atol=atol) for out in outs):
+            return True
+        print("[Surrogate] Fast evaluator disagrees with scipy's model; using scipy.")
+        return False
+
+    def _check_reduced_precision(self) -> None:
+        """Revert to a float64 plan if the reduced-precision one is too lossy."""
+        X, Y = self._X, self._Y
+        pred = self._fast_call(X)
+        ss_res = np.sum((Y - pred) ** 2, axis=0)
+        ss_tot = np.sum((Y - Y.mean(axis=0)) ** 2, axis=0)
+        r2 = 1.0 - ss_res / np.where(ss_tot > 0, ss_tot, 1.0)
+        if r2.min() < _REDUCED_PRECISION_MIN_R2:
+            print(
+                f"[Surrogate] {self._dtype} evaluation loses precision "
+                f"(training R^2 {r2.min():.8f}); using float64."
+            )
+            self._plan = _build_fast_plan(self._kernel, self._eval_params)
+
+    def _as_query(self, X) -> np.ndarray:
+        """Validate query points for the custom evaluators."""
+        X = np.ascontiguousarray(X, dtype=np.float64)
+        if X.ndim != 2 or X.shape[1] != self._X.shape[1]:
+            raise ValueError(f"Expected X of shape (n, {self._X.shape[1]}); got {X.shape}")
+        return X
 
     def predict_single(self, x: np.ndarray | list[float]) -> dict[str, float]:
-        """Predict all objectives for a single point."""
-        x_2d = np.atleast_2d(x)
-        preds = self.predict(x_2d)
-        return {name: float(arr[0]) for name, arr in preds.items()}
+        """Predict all objectives for a single point.
+
+        Evaluates the one-row query directly, without building the per-
+        objective arrays of :meth:`predict`.
+        """
+        xq = np.asarray(x, dtype=np.float64).reshape(1, -1)
+        return dict(zip(self._obj_names, self._evaluate(xq)[0].tolist()))
 
     # -- quality metrics ----------------------------------------------------
 
-    def get_r2_scores(self) -> dict[str, float]:
+    def get_r2_scores(self, n_workers: int | None = None) -> dict[str, float]:
         """Compute leave-one-out R^2 for each objective.
 
-        A score close to 1.0 indicates good surrogate fidelity.
+        A score close to 1.0 indicates good surrogate fidelity.  Global
+        models use Rippa's closed-form LOO residuals.  Local (``neighbors``)
+        models have no closed form and are refitted once per left-out point
+        with the same ``neighbors`` setting; those independent refits run on
+        a thread pool of ``n_workers`` threads (``None``: the executor
+        default, ``<= 1``: serial).
         """
         if self._X is None:
             raise RuntimeError("Model not fitted yet.")
 
         scores: dict[str, float] = {}
         X = self._X
+        Y = self._Y
         n = len(X)
 
-        for name in self._obj_names:
-            y = self._Y[name]
-            y_pred_loo = np.empty(n)
-            for i in range(n):
-                X_train = np.delete(X, i, axis=0)
-                y_train = np.delete(y, i)
-                loo_model = RBFInterpolator(X_train, y_train, kernel="thin_plate_spline")
-                y_pred_loo[i] = float(loo_model(X[[i]])[0])
+        if self._neighbors is None and self._kernel in _SCALE_INVARIANT_KERNELS:
+            Y_pred_loo = Y - self._loo_residuals_rippa()
+        else:
+            # One multi-output refit per left-out point covers all objectives.
+            # The LAPACK solves release the GIL, so threads suffice.
+            kernel, neighbors = self._kernel, self._neighbors
+            if n_workers is not None and n_workers <= 1:
+                rows = [_loo_predict(i, X, Y, kernel, neighbors) for i in range(n)]
+            else:
+                with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                    rows = list(executor.map(
+                        lambda i: _loo_predict(i, X, Y, kernel, neighbors), range(n)
+                    ))
+            Y_pred_loo = np.array(rows)
 
+        for j, name in enumerate(self._obj_names):
+            y = Y[:, j]
+            y_pred_loo = Y_pred_loo[:, j]
             ss_res = np.sum((y - y_pred_loo) ** 2)
             ss_tot = np.sum((y - np.mean(y)) ** 2)
             r2 = 1.0 - ss_res / ss_tot if ss_tot > 0 else 0.0
@@ -111,6 +510,56 @@ class SurrogateModel:
 
         return scores
 
+    def _loo_factorization(self) -> tuple[np.ndarray, np.ndarray]:
+        """LU factorization of the augmented matrix ``A = [[K, P], [P^T, 0]]``.
+
+        ``A`` depends only on the fitted inputs, so it is built and factorized
+        once per :meth:`fit` and shared by every objective and every call.
+        """
+        if self._loo_lu is not None:
+            return self._loo_lu
+
+        phi, degree = _SCALE_INVARIANT_KERNELS[self._kernel]
+        X = self._X
+        n = len(X)
+
+        # Same polynomial scaling as RBFInterpolator, for conditioning
+        mins, maxs = X.min(axis=0), X.max(axis=0)
+        shift = (maxs + mins) / 2
+        scale = (maxs - mins) / 2
+        scale[scale == 0.0] = 1.0
+        P = _polynomial_matrix((X - shift) / scale, degree)
+        m = P.shape[1]
+
+        A = np.empty((n + m, n + m))
+        A[:n, :n] = phi(self._D)
+        A[:n, n:] = P
+        A[n:, :n] = P.T
+        A[n:, n:] = 0.0
+
+        self._loo_lu = lu_factor(A)
+        return self._loo_lu
+
+    def _loo_residuals_rippa(self) -> np.ndarray:
+        """Exact LOO residuals ``y_k - s_{-k}(x_k)`` from one factorization.
+
+        Uses Rippa's identity ``e_k = c_k / (A^-1)_kk``, which gives the same
+        residuals as refitting without point ``k`` for every ``k``.
+        """
+        lu = self._loo_factorization()
+        Y = self._Y
+        n, k = Y.shape
+
+        # Solve for the coefficients of every objective and the first n
+        # columns of A^-1 in one multi-RHS pass (polynomial RHS is zero).
+        rhs = np.zeros((lu[0].shape[0], k + n))
+        rhs[:n, :k] = Y
+        rhs[np.arange(n), k + np.arange(n)] = 1.0
+        sol = lu_solve(lu, rhs)
+        C = sol[:n, :k]
+        diag = sol[np.arange(n), k + np.arange(n)]
+        return C / diag[:, None]
+
     def format_r2_report(self) -> str:
         """Return a human-readable R^2 report."""
         scores = self.get_r2_scores()
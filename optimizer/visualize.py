@@ -2,18 +2,22 @@
 
 All ``plot_*`` functions return a matplotlib Figure so callers can
 ``plt.show()`` **outside** the OpenRocketInstance context (JVM shutdown
-requirement).
+requirement).  Each also accepts existing axes (``ax=`` / ``axes=``) to draw
+into, so batched reports can lay out one figure themselves instead of
+paying for ``plt.subplots`` and ``tight_layout`` on every call.  Given axes
+are not cleared and the figure layout is left to the caller.
 """
 
 from __future__ import annotations
 
-import math
-
 import numpy as np
 from matplotlib import pyplot as plt
+from matplotlib.axes import Axes
 from matplotlib.figure import Figure
 
+from optimizer._table import format_column, markdown_table
 from optimizer.design_space import OptimizationProblem
+from optimizer.doe import records_to_arrays
 
 
 # ---------------------------------------------------------------------------
@@ -24,12 +28,20 @@ def plot_pareto_front(
     pareto_result: dict,
     problem: OptimizationProblem,
     top3: list[dict] | None = None,
+    ax: Axes | None = None,
 ) -> Figure:
-    """Scatter plot of the Pareto front (2-objective only)."""
+    """Scatter plot of the Pareto front (2-objective only).
+
+    Draws into ``ax`` when given, else into a new figure.
+    """
     F = pareto_result["F"]
     obj_names = [o.name for o in problem.objectives]
 
-    fig, ax = plt.subplots(figsize=(8, 6))
+    own_figure = ax is None
+    if own_figure:
+        fig, ax = plt.subplots(figsize=(8, 6))
+    else:
+        fig = ax.figure
     ax.scatter(F[:, 0], F[:, 1], c="steelblue", alpha=0.5, s=20, label="Pareto front")
 
     if top3:
@@ -50,7 +62,8 @@ def plot_pareto_front(
     ax.set_title("Pareto Front")
     ax.legend()
     ax.grid(True, alpha=0.3)
-    fig.tight_layout()
+    if own_figure:
+        fig.tight_layout()
     return fig
 
 
@@ -59,38 +72,71 @@ def plot_pareto_front(
 # ---------------------------------------------------------------------------
 
 def plot_doe_summary(
-    doe_results: list[dict],
+    doe_results: list[dict] | dict[str, np.ndarray],
     problem: OptimizationProblem,
+    axes: np.ndarray | None = None,
 ) -> Figure:
-    """Scatter matrix: each design variable vs each objective."""
+    """Scatter matrix: each design variable vs each objective.
+
+    ``doe_results`` is the ``run_doe`` record list or its
+    ``records_to_arrays`` form.  ``axes`` is an optional ``(n_obj, n_var)``
+    grid of existing axes to draw into.
+    """
     var_names = [v.name for v in problem.variables]
     obj_names = [o.name for o in problem.objectives]
 
     n_var = len(var_names)
     n_obj = len(obj_names)
 
-    X = np.array([r["x"] for r in doe_results])
-    feasible = np.array([r.get("feasible", True) for r in doe_results])
-
-    fig, axes = plt.subplots(n_obj, n_var, figsize=(4 * n_var, 3.5 * n_obj), squeeze=False)
+    if isinstance(doe_results, dict):
+        data = doe_results
+    else:
+        data = records_to_arrays(doe_results, problem)
+    X = data["X"]
+    simulated = data["simulated"]
+    # Skipped (surrogate-predicted) records are neither feasible nor infeasible
+    feasible = data["feasible"] & simulated
+    infeasible = ~data["feasible"] & simulated
+    # One stacked finiteness pass covers every objective row
+    Y = np.vstack([data[name] for name in obj_names]) if obj_names else np.empty((0, len(X)))
+    finite = np.isfinite(Y)
+
+    own_figure = axes is None
+    if own_figure:
+        fig, axes = plt.subplots(n_obj, n_var, figsize=(4 * n_var, 3.5 * n_obj), squeeze=False)
+    else:
+        axes = np.asarray(axes).reshape(n_obj, n_var)
+        fig = axes[0, 0].figure
 
     for row, obj_name in enumerate(obj_names):
-        y = np.array([r.get(obj_name, float("nan")) for r in doe_results])
+        y = Y[row]
+        # Masks depend only on the objective; split the points once per row
+        has_y = finite[row]
+        mask_f = feasible & has_y
+        mask_i = infeasible & has_y
+        mask_s = ~simulated & has_y
+        Xf, yf = X[mask_f], y[mask_f]
+        Xi, yi = X[mask_i], y[mask_i]
+        Xs, ys = X[mask_s], y[mask_s]
         for col, var_name in enumerate(var_names):
             ax = axes[row, col]
-            # Plot infeasible in grey, feasible in blue
-            mask_f = feasible & ~np.isnan(y)
-            mask_i = ~feasible & ~np.isnan(y)
-            if mask_i.any():
-                ax.scatter(X[mask_i, col], y[mask_i], c="grey", alpha=0.4, s=15, label="infeasible")
-            if mask_f.any():
-                ax.scatter(X[mask_f, col], y[mask_f], c="steelblue", alpha=0.7, s=25, label="feasible")
+            # Plot infeasible in grey, feasible in blue, skipped as hollow markers
+            if len(ys):
+                ax.scatter(
+                    Xs[:, col], ys, facecolors="none", edgecolors="grey",
+                    alpha=0.5, s=15, label="skipped (predicted)",
+                )
+            if len(yi):
+                ax.scatter(Xi[:, col], yi, c="grey", alpha=0.4, s=15, label="infeasible")
+            if len(yf):
+                ax.scatter(Xf[:, col], yf, c="steelblue", alpha=0.7, s=25, label="feasible")
             ax.set_xlabel(var_name)
             ax.set_ylabel(obj_name)
             ax.grid(True, alpha=0.3)
 
-    fig.suptitle("DOE: Variables vs Objectives", fontsize=14)
-    fig.tight_layout()
+    if own_figure:
+        fig.suptitle("DOE: Variables vs Objectives", fontsize=14)
+        fig.tight_layout()
     return fig
 
 
@@ -101,8 +147,12 @@ def plot_doe_summary(
 def plot_candidate_comparison(
     top3: list[dict],
     problem: OptimizationProblem,
+    ax: Axes | None = None,
 ) -> Figure:
-    """Bar chart comparing top-3 candidates across all objectives."""
+    """Bar chart comparing top-3 candidates across all objectives.
+
+    Draws into ``ax`` when given, else into a new figure.
+    """
     obj_names = [o.name for o in problem.objectives]
     n_obj = len(obj_names)
     n_cand = len(top3)
@@ -110,7 +160,11 @@ def plot_candidate_comparison(
     x_pos = np.arange(n_obj)
     width = 0.25
 
-    fig, ax = plt.subplots(figsize=(max(6, 2 * n_obj), 5))
+    own_figure = ax is None
+    if own_figure:
+        fig, ax = plt.subplots(figsize=(max(6, 2 * n_obj), 5))
+    else:
+        fig = ax.figure
     colors = ["#e74c3c", "#2ecc71", "#f39c12"]
 
     for i, cand in enumerate(top3):
@@ -124,7 +178,8 @@ def plot_candidate_comparison(
     ax.set_title("Top-3 Candidate Comparison")
     ax.legend()
     ax.grid(True, axis="y", alpha=0.3)
-    fig.tight_layout()
+    if own_figure:
+        fig.tight_layout()
     return fig
 
 
@@ -141,24 +196,15 @@ def format_results_table(
     obj_names = [o.name for o in problem.objectives]
 
     headers = ["Candidate"] + var_names + obj_names
-    rows: list[str] = []
-    rows.append("| " + " | ".join(headers) + " |")
-    rows.append("| " + " | ".join(["---"] * len(headers)) + " |")
-
-    for cand in top3:
-        cells = [cand["label"]]
-        for j, vn in enumerate(var_names):
-            v = cand["x"][j]
-            if problem.variables[j].is_integer:
-                cells.append(str(int(v)))
-            else:
-                cells.append(f"{v:.4f}")
-        for j, on in enumerate(obj_names):
-            val = cand["f"][j]
-            if math.isnan(val):
-                cells.append("NaN")
-            else:
-                cells.append(f"{val:.4f}")
-        rows.append("| " + " | ".join(cells) + " |")
-
-    return "\n".join(rows)
+
+    n_cand = len(top3)
+    X = np.array([cand["x"] for cand in top3], dtype=np.float64).reshape(n_cand, len(var_names))
+    F = np.array([cand["f"] for cand in top3], dtype=np.float64).reshape(n_cand, len(obj_names))
+
+    columns = [np.array([cand["label"] for cand in top3], dtype=str)]
+    columns += [
+        format_column(X[:, j], var.is_integer)
+        for j, var in enumerate(problem.variables)
+    ]
+    columns += [format_column(F[:, j]) for j in range(len(obj_names))]
+    return markdown_table(headers, columns)